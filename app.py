@@ -1,22 +1,222 @@
 import streamlit as st
 import pandas as pd
-import time
-from scraper import scrape_multiple_lazyportfolio_30y_metrics
+from scraper import cached_scrape_multiple_lazyportfolio_30y_metrics
 from utils import (
     filter_dataframe,
-    highlight_best_nominal_sharpe,
-    highlight_best_real_sharpe,
+    highlight_best_sharpe,
     format_dataframe_for_display,
     get_default_urls,
-)
-from visualization import (
-    create_returns_comparison_chart,
-    create_risk_return_scatter,
-    create_sharpe_comparison_chart,
-    create_radar_chart,
+    NUMERIC_DISPLAY_COLUMNS,
 )
 
 pd.options.display.float_format = "{:.2f}".format
+
+# Display columns the data table can be sorted by (it is sorted by label)
+_SORT_OPTIONS = ["Asset Name"] + NUMERIC_DISPLAY_COLUMNS
+
+
+@st.cache_data(ttl=3600, show_spinner=False)  # Cache for 1 hour
+def _cached_scrape(urls_tuple):
+    """
+    Scrape the given URLs, reusing results for an already fetched URL set.
+
+    Args:
+        urls_tuple (tuple): URLs to scrape (a tuple, so the cache key is stable)
+
+    Returns:
+        tuple: (DataFrame with scraped metrics, List of errors)
+    """
+    return cached_scrape_multiple_lazyportfolio_30y_metrics(list(urls_tuple))
+
+
+@st.fragment
+def render_data_table(filtered_df):
+    """
+    Render the sortable data table with links to the original sites.
+
+    Args:
+        filtered_df (pd.DataFrame): DataFrame with the assets that pass the filters
+    """
+    st.header("Asset Data")
+
+    # Sorting options
+    sort_col = st.selectbox(
+        "Sort by",
+        options=_SORT_OPTIONS,
+        index=_SORT_OPTIONS.index("Nominal Sharpe"),
+    )
+
+    sort_ascending = st.checkbox("Sort Ascending", value=False)
+
+    # Format DataFrame for display
+    display_df = format_dataframe_for_display(
+        filtered_df, sort_col=sort_col, sort_ascending=sort_ascending
+    )
+
+    # Apply styling to highlight best Sharpe ratios
+    styled_df = highlight_best_sharpe(display_df)
+
+    # Display the DataFrame
+    st.dataframe(styled_df, use_container_width=True)
+
+    # Display info about highlighting
+    st.info(
+        "📊 **Table Highlights:** Green = Best Nominal Sharpe, Blue = Best Real Sharpe"
+    )
+
+    # Add clickable links to original sites
+    st.markdown("### Links to Original Sites")
+    for _, row in filtered_df.iterrows():
+        st.markdown(f"- [{row['name']}]({row['url']})")
+
+
+@st.fragment
+def render_returns_comparison(filtered_df):
+    """
+    Render the returns and Sharpe ratio comparison charts.
+
+    Args:
+        filtered_df (pd.DataFrame): DataFrame with the assets that pass the filters
+    """
+    # Imported here so Plotly is only loaded once there is data to chart
+    from visualization import (
+        create_returns_comparison_chart,
+        create_sharpe_comparison_chart,
+    )
+
+    st.header("Returns Comparison")
+
+    # Returns bar chart
+    returns_chart = create_returns_comparison_chart(filtered_df)
+    st.plotly_chart(returns_chart, use_container_width=True)
+
+    # Sharpe ratio bar chart
+    sharpe_chart = create_sharpe_comparison_chart(filtered_df)
+    st.plotly_chart(sharpe_chart, use_container_width=True)
+
+
+@st.fragment
+def render_risk_analysis(filtered_df):
+    """
+    Render the risk vs return scatter plot and its explanation.
+
+    Args:
+        filtered_df (pd.DataFrame): DataFrame with the assets that pass the filters
+    """
+    from visualization import create_risk_return_scatter
+
+    st.header("Risk Analysis")
+
+    # Risk-return scatter plot
+    risk_return_chart = create_risk_return_scatter(filtered_df)
+    st.plotly_chart(risk_return_chart, use_container_width=True)
+
+    # Explanation
+    st.markdown(
+        """
+    ### Understanding the Risk-Return Chart
+    - **X-axis**: Standard Deviation (%) - measures volatility/risk
+    - **Y-axis**: Real 30Y Return (%) - shows inflation-adjusted returns
+    - **Bubble Size**: Nominal Sharpe Ratio - larger bubbles indicate better risk-adjusted returns
+
+    Ideally, you want assets in the upper left (high returns, low risk).
+    """,
+        unsafe_allow_html=False,
+    )
+
+
+@st.fragment
+def render_asset_comparison(filtered_df):
+    """
+    Render the radar chart and table for the selected assets.
+
+    Args:
+        filtered_df (pd.DataFrame): DataFrame with the assets that pass the filters
+    """
+    from visualization import create_radar_chart
+
+    st.header("Asset Comparison")
+
+    # Select assets to compare
+    selected_assets = st.multiselect(
+        "Select assets to compare",
+        options=filtered_df["name"].tolist(),
+        default=filtered_df["name"].tolist()[: min(3, len(filtered_df))],
+    )
+
+    if selected_assets:
+        # Radar chart for comparing assets
+        radar_chart = create_radar_chart(filtered_df, selected_assets)
+        if radar_chart:
+            st.plotly_chart(radar_chart, use_container_width=True)
+
+        # Side-by-side comparison table
+        comparison_df = filtered_df[filtered_df["name"].isin(selected_assets)]
+        st.dataframe(
+            format_dataframe_for_display(comparison_df), use_container_width=True
+        )
+    else:
+        st.warning("Please select at least one asset to compare.")
+
+
+@st.fragment
+def render_debug_info():
+    """
+    Render dataset details, current URLs and scraping errors.
+    """
+    st.header("Debug Information")
+
+    # Show debugging information
+    st.subheader("Dataset Information")
+    if "debug_info" in st.session_state:
+        debug_info = st.session_state.debug_info
+        cols = st.columns(3)
+        cols[0].metric("Rows", debug_info["shape"][0])
+        cols[1].metric("Columns", debug_info["shape"][1])
+        cols[2].metric("Last Update", debug_info["scrape_time"])
+
+        st.subheader("Columns")
+        st.write(debug_info["columns"])
+
+        # Show raw data sample
+        st.subheader("Raw Data Sample")
+        if st.checkbox("Show raw data sample"):
+            st.dataframe(st.session_state.data.head(3), use_container_width=True)
+    else:
+        st.info("No debug information available yet. Run 'Fetch Data' first.")
+
+    # Display URLs being used
+    st.subheader("Current URLs")
+    for i, url in enumerate(st.session_state.urls):
+        st.code(f"{i+1}. {url}", language=None)
+
+    # Display any scraping errors
+    st.subheader("Scraping Errors")
+    if st.session_state.errors:
+        for i, error in enumerate(st.session_state.errors):
+            with st.expander(f"Error {i+1}: {error['url'].split('/')[-2]}"):
+                st.error(f"URL: {error['url']}")
+                st.error(f"Error: {error['error']}")
+
+                # Provide troubleshooting suggestions based on error
+                if "Missing metrics" in error["error"]:
+                    st.warning("Possible causes:")
+                    st.markdown("- Webpage structure might have changed")
+                    st.markdown(
+                        "- Content might be loading dynamically with JavaScript"
+                    )
+                    st.markdown(
+                        "- Required metrics might use different naming patterns"
+                    )
+                elif "Error fetching URL" in error["error"]:
+                    st.warning("Network or URL issues:")
+                    st.markdown("- Check if the URL is accessible in a browser")
+                    st.markdown("- The website might be blocking scraping requests")
+                    st.markdown("- Network connection issues")
+    else:
+        st.success("No errors reported during scraping.")
+
+
 # Page config
 st.set_page_config(
     page_title="LazyPortfolio ETF Analyzer",
@@ -39,7 +239,7 @@ scraped from [lazyportfolioetf.com](https://www.lazyportfolioetf.com).
 if "data" not in st.session_state:
     st.session_state.data = None
 if "urls" not in st.session_state:
-    st.session_state.urls = get_default_urls()
+    st.session_state.urls = list(get_default_urls())
 if "errors" not in st.session_state:
     st.session_state.errors = []
 
@@ -62,20 +262,24 @@ if st.sidebar.button("Add URL"):
 st.sidebar.subheader("Current URLs")
 urls_to_remove = []
 
-for i, url in enumerate(st.session_state.urls):
-    col1, col2 = st.sidebar.columns([4, 1])
-    # Extract the last part of the URL (after the last /)
-    display_name = url.split("/")[-2] if url.endswith("/") else url.split("/")[-1]
-    col1.text(f"{i+1}. {display_name}")
-    if col2.button("❌", key=f"remove_{i}"):
-        urls_to_remove.append(url)
+# Batch removals in a form, so ticking URLs doesn't rerun the app until submit
+with st.sidebar.form("remove_urls", clear_on_submit=True):
+    marked_urls = []
+    for i, url in enumerate(st.session_state.urls):
+        # Extract the last part of the URL (after the last /)
+        display_name = url.split("/")[-2] if url.endswith("/") else url.split("/")[-1]
+        # Keyed by URL, so a mark stays with its URL when the list shifts
+        if st.checkbox(f"{i+1}. {display_name}", key=f"remove_{url}"):
+            marked_urls.append(url)
+    if st.form_submit_button("❌ Remove Selected"):
+        urls_to_remove = marked_urls
 
 # Remove URLs that were marked for removal
-for url in urls_to_remove:
-    st.session_state.urls.remove(url)
-    # If we're removing URLs, we need to refresh
-    if url in urls_to_remove:
-        st.rerun()
+if urls_to_remove:
+    removed = set(urls_to_remove)
+    st.session_state.urls = [u for u in st.session_state.urls if u not in removed]
+    # Refresh once, after all the marked URLs are gone
+    st.rerun()
 
 # Fetch data button
 if st.sidebar.button("Fetch Data"):
@@ -85,11 +289,20 @@ if st.sidebar.button("Fetch Data"):
         status_container.info("Starting data scraping process...")
 
         # Scrape data from URLs
-        df, errors = scrape_multiple_lazyportfolio_30y_metrics(st.session_state.urls)
+        df, errors = _cached_scrape(tuple(st.session_state.urls))
+        if errors:
+            # Don't memoize a partial result, so failing URLs are retried on
+            # the next fetch instead of for the rest of the hour
+            _cached_scrape.clear(tuple(st.session_state.urls))
 
         # Display results
         if not df.empty:
             st.session_state.data = df
+            st.session_state.last_updated = df["scrape_time"].iloc[0]
+            # Slider bounds only change with the data, so compute them once here
+            st.session_state.data_bounds = df[
+                ["nominal_30y_return", "real_30y_return", "std_deviation"]
+            ].agg(["min", "max"])
             st.session_state.errors = errors
 
             # Show success message with details
@@ -132,25 +345,27 @@ if st.sidebar.button("Fetch Data"):
 # Filtering Section
 st.sidebar.header("Filters")
 if st.session_state.data is not None:
+    bounds = st.session_state.data_bounds
+
     min_nominal_return = st.sidebar.slider(
         "Min Nominal Return (%)",
-        min_value=float(st.session_state.data["nominal_30y_return"].min()),
-        max_value=float(st.session_state.data["nominal_30y_return"].max()),
-        value=float(st.session_state.data["nominal_30y_return"].min()),
+        min_value=float(bounds.loc["min", "nominal_30y_return"]),
+        max_value=float(bounds.loc["max", "nominal_30y_return"]),
+        value=float(bounds.loc["min", "nominal_30y_return"]),
     )
 
     min_real_return = st.sidebar.slider(
         "Min Real Return (%)",
-        min_value=float(st.session_state.data["real_30y_return"].min()),
-        max_value=float(st.session_state.data["real_30y_return"].max()),
-        value=float(st.session_state.data["real_30y_return"].min()),
+        min_value=float(bounds.loc["min", "real_30y_return"]),
+        max_value=float(bounds.loc["max", "real_30y_return"]),
+        value=float(bounds.loc["min", "real_30y_return"]),
     )
 
     max_std_dev = st.sidebar.slider(
         "Max Standard Deviation (%)",
-        min_value=float(st.session_state.data["std_deviation"].min()),
-        max_value=float(st.session_state.data["std_deviation"].max()),
-        value=float(st.session_state.data["std_deviation"].max()),
+        min_value=float(bounds.loc["min", "std_deviation"]),
+        max_value=float(bounds.loc["max", "std_deviation"]),
+        value=float(bounds.loc["max", "std_deviation"]),
     )
 
     filtered_df = filter_dataframe(
@@ -167,7 +382,7 @@ st.sidebar.markdown("---", unsafe_allow_html=False)
 st.sidebar.caption(
     "Data Source: [lazyportfolioetf.com](https://www.lazyportfolioetf.com)"
 )
-st.sidebar.caption(f"Last Updated: {time.strftime('%Y-%m-%d %H:%M:%S')}")
+st.sidebar.caption(f"Last Updated: {st.session_state.get('last_updated', 'never')}")
 
 # Main content area
 if st.session_state.data is not None and not filtered_df.empty:
@@ -185,13 +400,16 @@ if st.session_state.data is not None and not filtered_df.empty:
         ),
     )
 
-    col2.metric(
-        "Avg Nominal Return", f"{filtered_df['nominal_30y_return'].mean():.2f}%"
-    )
+    # Averages of the three metrics, in a single reduction
+    means = filtered_df[
+        ["nominal_30y_return", "real_30y_return", "std_deviation"]
+    ].mean()
+
+    col2.metric("Avg Nominal Return", f"{means['nominal_30y_return']:.2f}%")
 
-    col3.metric("Avg Real Return", f"{filtered_df['real_30y_return'].mean():.2f}%")
+    col3.metric("Avg Real Return", f"{means['real_30y_return']:.2f}%")
 
-    col4.metric("Avg Std Deviation", f"{filtered_df['std_deviation'].mean():.2f}%")
+    col4.metric("Avg Std Deviation", f"{means['std_deviation']:.2f}%")
 
     # Tabs for different views
     tab1, tab2, tab3, tab4, tab5 = st.tabs(
@@ -205,167 +423,19 @@ if st.session_state.data is not None and not filtered_df.empty:
     )
 
     with tab1:
-        st.header("Asset Data")
-
-        # Sorting options
-        sort_col = st.selectbox(
-            "Sort by",
-            options=[
-                "Asset Name",
-                "30Y Nominal Return (%)",
-                "30Y Real Return (%)",
-                "Std Deviation (%)",
-                "Nominal Sharpe",
-                "Real Sharpe",
-            ],
-            index=4,  # Default to nominal Sharpe
-        )
-
-        # Convert display column name back to DataFrame column name
-        sort_col_mapping = {
-            "Asset Name": "name",
-            "30Y Nominal Return (%)": "nominal_30y_return",
-            "30Y Real Return (%)": "real_30y_return",
-            "Std Deviation (%)": "std_deviation",
-            "Nominal Sharpe": "nominal_sharpe",
-            "Real Sharpe": "real_sharpe",
-        }
-
-        sort_ascending = st.checkbox("Sort Ascending", value=False)
-
-        # Format DataFrame for display
-        display_df = format_dataframe_for_display(
-            filtered_df, sort_col=sort_col, sort_ascending=sort_ascending
-        )
-
-        # Sort the DataFrame
-        df_col_name = sort_col_mapping[sort_col]
-
-        # Apply styling to highlight best Sharpe ratios
-        styled_df = display_df.apply(
-            highlight_best_nominal_sharpe, subset=["Nominal Sharpe"]
-        ).apply(highlight_best_real_sharpe, subset=["Real Sharpe"])
-
-        # Display the DataFrame
-        st.dataframe(styled_df, use_container_width=True)
-
-        # Display info about highlighting
-        st.info(
-            "📊 **Table Highlights:** Green = Best Nominal Sharpe, Blue = Best Real Sharpe"
-        )
-
-        # Add clickable links to original sites
-        st.markdown("### Links to Original Sites")
-        for _, row in filtered_df.iterrows():
-            st.markdown(f"- [{row['name']}]({row['url']})")
+        render_data_table(filtered_df)
 
     with tab2:
-        st.header("Returns Comparison")
-
-        # Returns bar chart
-        returns_chart = create_returns_comparison_chart(filtered_df)
-        st.plotly_chart(returns_chart, use_container_width=True)
-
-        # Sharpe ratio bar chart
-        sharpe_chart = create_sharpe_comparison_chart(filtered_df)
-        st.plotly_chart(sharpe_chart, use_container_width=True)
+        render_returns_comparison(filtered_df)
 
     with tab3:
-        st.header("Risk Analysis")
-
-        # Risk-return scatter plot
-        risk_return_chart = create_risk_return_scatter(filtered_df)
-        st.plotly_chart(risk_return_chart, use_container_width=True)
-
-        # Explanation
-        st.markdown(
-            """
-        ### Understanding the Risk-Return Chart
-        - **X-axis**: Standard Deviation (%) - measures volatility/risk
-        - **Y-axis**: Real 30Y Return (%) - shows inflation-adjusted returns
-        - **Bubble Size**: Nominal Sharpe Ratio - larger bubbles indicate better risk-adjusted returns
-        
-        Ideally, you want assets in the upper left (high returns, low risk).
-        """,
-            unsafe_allow_html=False,
-        )
+        render_risk_analysis(filtered_df)
 
     with tab4:
-        st.header("Asset Comparison")
-
-        # Select assets to compare
-        selected_assets = st.multiselect(
-            "Select assets to compare",
-            options=filtered_df["name"].tolist(),
-            default=filtered_df["name"].tolist()[: min(3, len(filtered_df))],
-        )
-
-        if selected_assets:
-            # Radar chart for comparing assets
-            radar_chart = create_radar_chart(filtered_df, selected_assets)
-            if radar_chart:
-                st.plotly_chart(radar_chart, use_container_width=True)
-
-            # Side-by-side comparison table
-            comparison_df = filtered_df[filtered_df["name"].isin(selected_assets)]
-            st.dataframe(
-                format_dataframe_for_display(comparison_df), use_container_width=True
-            )
-        else:
-            st.warning("Please select at least one asset to compare.")
+        render_asset_comparison(filtered_df)
 
     with tab5:
-        st.header("Debug Information")
-
-        # Show debugging information
-        st.subheader("Dataset Information")
-        if "debug_info" in st.session_state:
-            debug_info = st.session_state.debug_info
-            cols = st.columns(3)
-            cols[0].metric("Rows", debug_info["shape"][0])
-            cols[1].metric("Columns", debug_info["shape"][1])
-            cols[2].metric("Last Update", debug_info["scrape_time"])
-
-            st.subheader("Columns")
-            st.write(debug_info["columns"])
-
-            # Show raw data sample
-            st.subheader("Raw Data Sample")
-            if st.checkbox("Show raw data sample"):
-                st.dataframe(st.session_state.data.head(3), use_container_width=True)
-        else:
-            st.info("No debug information available yet. Run 'Fetch Data' first.")
-
-        # Display URLs being used
-        st.subheader("Current URLs")
-        for i, url in enumerate(st.session_state.urls):
-            st.code(f"{i+1}. {url}", language=None)
-
-        # Display any scraping errors
-        st.subheader("Scraping Errors")
-        if st.session_state.errors:
-            for i, error in enumerate(st.session_state.errors):
-                with st.expander(f"Error {i+1}: {error['url'].split('/')[-2]}"):
-                    st.error(f"URL: {error['url']}")
-                    st.error(f"Error: {error['error']}")
-
-                    # Provide troubleshooting suggestions based on error
-                    if "Missing metrics" in error["error"]:
-                        st.warning("Possible causes:")
-                        st.markdown("- Webpage structure might have changed")
-                        st.markdown(
-                            "- Content might be loading dynamically with JavaScript"
-                        )
-                        st.markdown(
-                            "- Required metrics might use different naming patterns"
-                        )
-                    elif "Error fetching URL" in error["error"]:
-                        st.warning("Network or URL issues:")
-                        st.markdown("- Check if the URL is accessible in a browser")
-                        st.markdown("- The website might be blocking scraping requests")
-                        st.markdown("- Network connection issues")
-        else:
-            st.success("No errors reported during scraping.")
+        render_debug_info()
 
 elif st.session_state.data is not None and filtered_df.empty:
     st.warning(
@@ -1,34 +1,51 @@
-import requests
 import os
+import re
+import time
 from bs4 import BeautifulSoup
+from scraper import create_session, REQUEST_TIMEOUT
 
-def save_sample_html(url, output_file='sample_page.html'):
+# Reuse one keep-alive connection for all the pages fetched in a run
+_SESSION = create_session()
+
+# Text nodes holding a percentage value, which might be one of our metrics
+PERCENT_TEXT = re.compile(r'\d%')
+METRIC_TERMS = ['return', 'deviation', 'yield']
+
+def save_sample_html(url, output_file='sample_page.html', ttl=3600, force=False):
     """
     Save the HTML content of a URL to a file for debugging purposes.
     
+    If output_file was saved less than ttl seconds ago, it is analyzed again
+    without fetching the page, so parser tweaks can be iterated offline.
+    
     Args:
         url (str): URL to fetch
         output_file (str): Path to save the HTML content
+        ttl (int): Seconds during which a saved file is reused
+        force (bool): Fetch the page even if a fresh file exists
     """
-    print(f"Fetching HTML from: {url}")
-    
-    # Use a realistic user agent to avoid being blocked
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
-    
     try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        
-        # Save the raw HTML
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(response.text)
-        
-        print(f"HTML saved to {output_file}")
+        if (not force and os.path.exists(output_file)
+                and time.time() - os.path.getmtime(output_file) < ttl):
+            print(f"Reusing HTML saved in {output_file} for: {url}")
+            with open(output_file, 'r', encoding='utf-8') as f:
+                html = f.read()
+        else:
+            print(f"Fetching HTML from: {url}")
+            
+            # The session already sends a realistic user agent to avoid being blocked
+            response = _SESSION.get(url, timeout=REQUEST_TIMEOUT)
+            response.raise_for_status()
+            html = response.text
+            
+            # Save the raw HTML
+            with open(output_file, 'w', encoding='utf-8') as f:
+                f.write(html)
+            
+            print(f"HTML saved to {output_file}")
         
         # Parse and print some basic information about the page
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = BeautifulSoup(html, 'lxml')
         
         # Print the title
         title = soup.title.string if soup.title else "No title found"
@@ -43,11 +60,19 @@ def save_sample_html(url, output_file='sample_page.html'):
             'all_divs_with_percent': []
         }
         
-        # Look for text containing percentage values, which might be our metrics
-        for div in soup.find_all('div'):
-            text = div.get_text()
-            if '%' in text and any(term in text.lower() for term in ['return', 'deviation', 'yield']):
-                div_containers['all_divs_with_percent'].append(div)
+        # Look for text containing percentage values, which might be our metrics.
+        # Start from the matching text nodes and walk up to the closest div that
+        # mentions a metric, instead of extracting the text of every div in the page.
+        seen_divs = set()
+        for text_node in soup.find_all(string=PERCENT_TEXT):
+            for div in text_node.find_parents('div'):
+                if id(div) in seen_divs:
+                    break
+                seen_divs.add(id(div))
+                text = div.get_text().lower()
+                if any(term in text for term in METRIC_TERMS):
+                    div_containers['all_divs_with_percent'].append(div)
+                    break
         
         # Print summary of found elements
         for container_type, elements in div_containers.items():
@@ -1,10 +1,22 @@
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 import pandas as pd
+import pyarrow as pa
 import re
+import time
+import hashlib
+import json
 import logging
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-import streamlit as st
+from html import unescape
+from pathlib import Path
+from urllib.parse import urlparse
 
 # Configure logging
 logging.basicConfig(
@@ -12,35 +24,291 @@ logging.basicConfig(
 )
 logger = logging.getLogger("scraper")
 
+# All URLs live on the same host, so keep concurrency polite
+MAX_WORKERS = 8
+# Minimum seconds between the start of two requests to the same host
+MIN_REQUEST_INTERVAL = 0.3
+# Seconds to wait for the server (connect, read) before giving up on a request
+REQUEST_TIMEOUT = (5, 30)
+# Bytes read at a time while looking for the metrics in a downloaded page
+CHUNK_SIZE = 16384
+
+# Scraped results are kept on disk so new processes don't have to re-scrape
+CACHE_DIR = Path.home() / ".cache" / "etf_compare"
+CACHE_TTL_HOURS = 24
+# Metrics and validators (ETag, Last-Modified) of each page, so unchanged
+# pages can be revalidated with a conditional request instead of re-parsed
+PAGE_CACHE_DIR = CACHE_DIR / "pages"
+
+# Metric patterns, compiled once instead of on every paragraph/container
+# (the named group that matched tells which metric was found)
+_PARAGRAPH_METRICS_RE = re.compile(
+    r"(?P<nominal>\d+\.\d+)%\s+compound annual return"
+    r"|with a\s+(?P<std>\d+\.\d+)%\s+standard deviation"
+    r"|(?P<real>\d+\.\d+)%\s+inflation adjusted"
+)
+_FALLBACK_RETURN_RE = re.compile(r"(?:annual|return|cagr)[^\d]*(\d+\.\d+)%")
+_FALLBACK_STD_DEVIATION_RE = re.compile(
+    r"(?:standard deviation|std|volatility)[^\d]*(\d+\.\d+)%"
+)
+# First heading in the raw HTML, which holds the asset name
+_H1_RE = re.compile(rb"<h1(?:\s[^>]*)?>(.*?)</h1>", re.DOTALL | re.IGNORECASE)
+
+# Elements the name and paragraph scans need, so the rest of the page (scripts,
+# navigation, layout divs) isn't built into the tree
+_PARAGRAPH_STRAINER = SoupStrainer(["h1", "title", "p"])
+
+# Arrow-backed dtype of each scraped metric, in column order. Arrow columns
+# match what Streamlit serializes to the frontend, so rendering the table
+# skips a NumPy to Arrow conversion on every rerun
+METRIC_DTYPES = {
+    "name": pd.ArrowDtype(pa.string()),
+    "url": pd.ArrowDtype(pa.string()),
+    "nominal_30y_return": pd.ArrowDtype(pa.float64()),
+    "real_30y_return": pd.ArrowDtype(pa.float64()),
+    "std_deviation": pd.ArrowDtype(pa.float64()),
+    "nominal_sharpe": pd.ArrowDtype(pa.float64()),
+    "real_sharpe": pd.ArrowDtype(pa.float64()),
+    "is_real_return_estimated": pd.ArrowDtype(pa.bool_()),
+}
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+
+
+def create_session():
+    """
+    Create an HTTP session with keep-alive connection pooling and retries.
 
-def scrape_lazyportfolio_30y_metrics(url):
+    Returns:
+        requests.Session: Session with the scraper's User-Agent set
     """
-    Scrape financial metrics from a lazyportfolioetf.com URL.
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=20,
+        pool_maxsize=20,
+        # Also retry rate limiting and transient server errors, not just
+        # connection failures
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"User-Agent": USER_AGENT})
+    return session
+
+
+# Shared across worker threads so TLS handshakes are reused between URLs
+_SESSION = create_session()
+
+# Earliest time (time.monotonic) at which each host may be requested again
+_next_request_time = {}
+_next_request_lock = threading.Lock()
+
+
+def _wait_for_host(url):
+    """
+    Block until the URL's host may be requested again.
+
+    Requests to the same host are spaced by MIN_REQUEST_INTERVAL across all
+    worker threads, while requests to other hosts are not delayed.
 
     Args:
-        url (str): URL of the page to scrape
+        url (str): URL about to be requested
+    """
+    host = urlparse(url).netloc
+    with _next_request_lock:
+        now = time.monotonic()
+        start = max(now, _next_request_time.get(host, now))
+        _next_request_time[host] = start + MIN_REQUEST_INTERVAL
+    time.sleep(start - now)
 
-    Returns:
-        dict: Dictionary with scraped metrics
+
+def fetch_page(url, headers=None):
     """
-    logger.info(f"Scraping URL: {url}")
+    Download a lazyportfolioetf.com page.
 
-    # Get the webpage content
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-    }
+    The page is streamed and only kept until the asset name and metrics have
+    been received. The rest of the page is drained without being decoded,
+    keeping the connection reusable for the next request to the host.
+
+    Args:
+        url (str): URL of the page to fetch
+        headers (dict, optional): Extra request headers, e.g. for a conditional request
+
+    Returns:
+        tuple: (requests.Response, bytes with the raw content read from the page,
+        empty for a 304 response if the page didn't change)
+    """
     try:
         logger.info(f"Sending request to: {url}")
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        logger.info(f"Received response: Status code {response.status_code}")
+        response = _SESSION.get(
+            url, headers=headers, timeout=REQUEST_TIMEOUT, stream=True
+        )
+        try:
+            response.raise_for_status()
+            logger.info(f"Received response: Status code {response.status_code}")
+            content = _read_until_metrics(response)
+            # Discard the rest of the page without decoding it, so the
+            # connection goes back to the pool instead of being closed
+            response.raw.drain_conn()
+        finally:
+            response.close()
     except requests.exceptions.RequestException as e:
         error_msg = f"Error fetching URL {url}: {str(e)}"
         logger.error(error_msg)
         raise ValueError(error_msg)
 
+    return response, content
+
+
+def _read_until_metrics(response):
+    """
+    Read a streamed page until the asset name and metrics can be scanned from it.
+
+    Reading only stops once the raw HTML scan succeeds on what was read, so
+    parsing the shorter content gives the same result as the whole page.
+
+    Args:
+        response (requests.Response): Streamed response of the page
+
+    Returns:
+        bytes: Content up to the end of the paragraph holding the nominal return
+        and standard deviation, or the whole page if they couldn't be scanned
+    """
+    content = bytearray()
+    for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+        # Rescan the end of the previous chunk, in case a tag was split
+        start = max(0, len(content) - 8)
+        content.extend(chunk)
+
+        # The scan can only succeed once another paragraph has been closed
+        if b"</p>" in content[start:].lower() and _scan_raw_html(content):
+            logger.info(f"Found metrics after reading {len(content)} bytes")
+            break
+
+    return bytes(content)
+
+
+def _page_cache_file(url):
+    """
+    Get the on-disk cache file for a single page.
+
+    Args:
+        url (str): URL of the page
+
+    Returns:
+        Path: JSON file holding the page's validators and metrics
+    """
+    key = hashlib.md5(url.encode("utf-8")).hexdigest()
+    return PAGE_CACHE_DIR / f"{key}.json"
+
+
+def _load_page_cache(url):
+    """
+    Load the validators and metrics saved for a page.
+
+    Args:
+        url (str): URL of the page
+
+    Returns:
+        dict: Saved etag, last_modified and metrics, or None if there are none
+    """
+    try:
+        return json.loads(_page_cache_file(url).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def _save_page_cache(url, response, metrics):
+    """
+    Save a page's metrics along with the validators sent by the server.
+
+    Nothing is saved when the server sends neither an ETag nor a
+    Last-Modified header, as the page couldn't be revalidated.
+
+    Args:
+        url (str): URL of the page
+        response (requests.Response): Response the metrics were parsed from
+        metrics (dict): Dictionary with scraped metrics
+    """
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if not etag and not last_modified:
+        return
+
+    cache_file = _page_cache_file(url)
+    try:
+        PAGE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(
+            json.dumps(
+                {"etag": etag, "last_modified": last_modified, "metrics": metrics}
+            ),
+            encoding="utf-8",
+        )
+    except OSError as e:
+        logger.warning(f"Could not save page cache to {cache_file}: {e}")
+
+
+def scrape_lazyportfolio_30y_metrics(url):
+    """
+    Scrape financial metrics from a lazyportfolioetf.com URL.
+
+    Pages scraped before are requested conditionally, and their saved
+    metrics are reused if the server answers that they didn't change.
+
+    Args:
+        url (str): URL of the page to scrape
+
+    Returns:
+        dict: Dictionary with scraped metrics
+    """
+    logger.info(f"Scraping URL: {url}")
+
+    cached = _load_page_cache(url)
+    headers = {}
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    response, content = fetch_page(url, headers)
+    if response.status_code == 304 and cached:
+        logger.info(f"Page not modified, reusing saved metrics for: {url}")
+        return cached["metrics"]
+
+    metricas = parse_lazyportfolio_30y_metrics(content, url)
+    _save_page_cache(url, response, metricas)
+    return metricas
+
+
+def parse_lazyportfolio_30y_metrics(html, url):
+    """
+    Extract financial metrics from the HTML of a lazyportfolioetf.com page.
+
+    Args:
+        html (bytes): Raw content of the page
+        url (str): URL the page was fetched from
+
+    Returns:
+        dict: Dictionary with scraped metrics
+    """
+    # Fast path: most pages show the metrics as plain text, so they can be
+    # read from the raw HTML without building the whole document tree
+    raw_metrics = _scan_raw_html(html)
+    if raw_metrics is not None:
+        nombre, nominal, real, std = raw_metrics
+        logger.info(
+            f"Found metrics in raw HTML for {nombre} - Nominal: {nominal}%, "
+            f"Std Deviation: {std}%, Real: {real}%"
+        )
+        return _build_metrics(url, *raw_metrics)
+
     # Parse the HTML
-    soup = BeautifulSoup(response.text, "html.parser")
+    soup = BeautifulSoup(html, "lxml", parse_only=_PARAGRAPH_STRAINER)
 
     # Initialize variables
     retorno_30y_nominal = None
@@ -71,44 +339,44 @@ def scrape_lazyportfolio_30y_metrics(url):
 
     for p in paragraphs:
         text = p.get_text()
-        logger.debug(f"Checking paragraph: {text[:100]}...")
+        lowered = text.lower()
 
         # Look for the standard pattern with compound annual return and std deviation
-        if (
-            "compound annual return" in text.lower()
-            and "standard deviation" in text.lower()
-        ):
+        if "compound annual return" in lowered and "standard deviation" in lowered:
             logger.info(f"Found paragraph with metrics: {text}")
 
-            # Extract the nominal return
-            nominal_match = re.search(r"(\d+\.\d+)%\s+compound annual return", text)
-            if nominal_match:
-                retorno_30y_nominal = float(nominal_match.group(1))
+            # Extract the metrics in a single pass over the paragraph, keeping
+            # the first value found for each one
+            found = {}
+            for match in _PARAGRAPH_METRICS_RE.finditer(text):
+                found.setdefault(match.lastgroup, float(match.group(match.lastgroup)))
+                if len(found) == 3:
+                    break
+
+            if "nominal" in found:
+                retorno_30y_nominal = found["nominal"]
                 logger.info(f"Found nominal return: {retorno_30y_nominal}%")
 
-            # Extract the standard deviation
-            std_dev_match = re.search(
-                r"with a\s+(\d+\.\d+)%\s+standard deviation", text
-            )
-            if std_dev_match:
-                desvio_estandar = float(std_dev_match.group(1))
+            if "std" in found:
+                desvio_estandar = found["std"]
                 logger.info(f"Found standard deviation: {desvio_estandar}%")
 
             # For real return, check for inflation adjusted or try to calculate
-            if "inflation adjusted" in text.lower():
-                real_match = re.search(r"(\d+\.\d+)%\s+inflation adjusted", text)
-                if real_match:
-                    retorno_30y_real = float(real_match.group(1))
-                    logger.info(f"Found real return: {retorno_30y_real}%")
+            if "real" in found:
+                retorno_30y_real = found["real"]
+                logger.info(f"Found real return: {retorno_30y_real}%")
 
             # If all is good, break
-            if retorno_30y_nominal and desvio_estandar:
+            if retorno_30y_nominal is not None and desvio_estandar is not None:
                 break
 
     # Second approach: Look for metrics in the stats elements or other containers
-    if not retorno_30y_nominal or not desvio_estandar:
+    if retorno_30y_nominal is None or desvio_estandar is None:
         logger.info("Trying alternate method to find metrics...")
 
+        # The containers can be any div in the page, so parse all of it
+        soup = BeautifulSoup(html, "lxml")
+
         # Look for metrics in specific containers that might hold them
         metric_containers = []
         metric_containers.extend(
@@ -134,44 +402,33 @@ def scrape_lazyportfolio_30y_metrics(url):
 
         for container in metric_containers:
             text = container.get_text()
-            logger.debug(f"Checking container: {text[:100]}...")
+            lowered = text.lower()
 
             # Look for return values with % sign
             if "%" in text and any(
-                term in text.lower() for term in ["return", "cagr", "annual"]
+                term in lowered for term in ["return", "cagr", "annual"]
             ):
                 logger.info(f"Found container with possible metrics: {text[:200]}...")
 
                 # Try to find nominal return
-                if not retorno_30y_nominal:
+                if retorno_30y_nominal is None:
                     # Pattern for "return" followed by percentage
-                    nom_match = re.search(
-                        r"(?:annual|return|cagr)[^\d]*(\d+\.\d+)%", text.lower()
-                    )
+                    nom_match = _FALLBACK_RETURN_RE.search(lowered)
                     if nom_match:
                         retorno_30y_nominal = float(nom_match.group(1))
                         logger.info(f"Found nominal return: {retorno_30y_nominal}%")
 
                 # Try to find standard deviation
-                if not desvio_estandar:
+                if desvio_estandar is None:
                     # Pattern for standard deviation or volatility
-                    std_match = re.search(
-                        r"(?:standard deviation|std|volatility)[^\d]*(\d+\.\d+)%",
-                        text.lower(),
-                    )
+                    std_match = _FALLBACK_STD_DEVIATION_RE.search(lowered)
                     if std_match:
                         desvio_estandar = float(std_match.group(1))
                         logger.info(f"Found standard deviation: {desvio_estandar}%")
 
-    # If we haven't found real return yet, estimate it as nominal - 3% (typical inflation)
-    if retorno_30y_nominal and not retorno_30y_real:
-        retorno_30y_real = retorno_30y_nominal - 3.0
-        logger.warning(
-            f"Real return not found, estimating as nominal - 3%: {retorno_30y_real}%"
-        )
-        logger.warning(
-            "This is an estimation - actual inflation-adjusted returns may vary"
-        )
+            # Stop scanning containers once both metrics are found
+            if retorno_30y_nominal is not None and desvio_estandar is not None:
+                break
 
     # Check if we have the minimum required metrics to proceed
     missing_metrics = []
@@ -199,6 +456,122 @@ def scrape_lazyportfolio_30y_metrics(url):
 
         raise ValueError(error_msg)
 
+    return _build_metrics(
+        url, nombre, retorno_30y_nominal, retorno_30y_real, desvio_estandar
+    )
+
+
+def _scan_raw_html(html):
+    """
+    Extract the asset name and metrics from the raw HTML with regular expressions.
+
+    Matches what the parsed document would give: the name comes from the first
+    <h1> and the metrics from the first paragraph mentioning both the compound
+    annual return and the standard deviation.
+
+    Args:
+        html (bytes): Raw content of the page
+
+    Returns:
+        tuple: (name, nominal return, real return or None, std deviation), or
+        None if the page doesn't show them as plain text
+    """
+    paragraph = _find_metrics_paragraph(html)
+    if paragraph is None:
+        return None
+
+    # A heading with markup inside needs the parser to get its text
+    name_match = _H1_RE.search(html)
+    if not name_match or b"<" in name_match.group(1):
+        return None
+
+    found = {}
+    text = paragraph.decode("utf-8", errors="replace")
+    for match in _PARAGRAPH_METRICS_RE.finditer(text):
+        found.setdefault(match.lastgroup, float(match.group(match.lastgroup)))
+        if len(found) == 3:
+            break
+
+    if "nominal" not in found or "std" not in found:
+        return None
+
+    nombre = unescape(name_match.group(1).decode("utf-8", errors="replace")).strip()
+    return nombre, found["nominal"], found.get("real"), found["std"]
+
+
+def _find_metrics_paragraph(html):
+    """
+    Find the raw paragraph holding the compound annual return in the HTML.
+
+    Mentions outside a paragraph (meta tags, scripts) are skipped. The first
+    complete paragraph with one decides, so an earlier paragraph the parser
+    would pick is never passed over.
+
+    Args:
+        html (bytes): Raw content of the page, possibly only its beginning
+
+    Returns:
+        bytes: The paragraph, from its opening <p> to its closing </p>, or None
+        if it wasn't found or doesn't also mention the standard deviation
+    """
+    # Lowercasing bytes keeps the offsets, and the parser ignores case too
+    lowered = html.lower()
+    pos = lowered.find(b"compound annual return")
+    while pos != -1:
+        start = _paragraph_start(lowered, pos)
+        if start != -1 and lowered.find(b"</p>", start, pos) == -1:
+            end = lowered.find(b"</p>", pos)
+            if end == -1 or b"standard deviation" not in lowered[start:end]:
+                return None
+            return html[start : end + len(b"</p>")]
+        pos = lowered.find(b"compound annual return", pos + 1)
+    return None
+
+
+def _paragraph_start(lowered, pos):
+    """
+    Find the last <p> tag opened before a position of the lowercased HTML.
+
+    Args:
+        lowered (bytes): Lowercased raw content of the page
+        pos (int): Position to search back from
+
+    Returns:
+        int: Offset of the tag, or -1 if there is none
+    """
+    start = lowered.rfind(b"<p", 0, pos)
+    # Skip other tags starting with "p", like <pre> or <path>
+    while start != -1 and lowered[start + 2 : start + 3] not in b" \t\r\n>":
+        start = lowered.rfind(b"<p", 0, start)
+    return start
+
+
+def _build_metrics(url, nombre, retorno_30y_nominal, retorno_30y_real, desvio_estandar):
+    """
+    Complete the scraped metrics with the derived values.
+
+    Args:
+        url (str): URL the page was fetched from
+        nombre (str): Asset name
+        retorno_30y_nominal (float): 30Y nominal return
+        retorno_30y_real (float): 30Y real return, or None if it wasn't found
+        desvio_estandar (float): Standard deviation
+
+    Returns:
+        dict: Dictionary with scraped metrics
+    """
+    is_estimated = retorno_30y_real is None
+
+    # If we haven't found real return yet, estimate it as nominal - 3% (typical inflation)
+    if retorno_30y_nominal is not None and retorno_30y_real is None:
+        retorno_30y_real = retorno_30y_nominal - 3.0
+        logger.warning(
+            f"Real return not found, estimating as nominal - 3%: {retorno_30y_real}%"
+        )
+        logger.warning(
+            "This is an estimation - actual inflation-adjusted returns may vary"
+        )
+
     # Calculate Sharpe ratios
     cociente_nominal = (
         retorno_30y_nominal / desvio_estandar if desvio_estandar != 0 else 0
@@ -217,36 +590,59 @@ def scrape_lazyportfolio_30y_metrics(url):
         "std_deviation": desvio_estandar,
         "nominal_sharpe": cociente_nominal,
         "real_sharpe": cociente_real,
-        "scrape_time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-        "is_real_return_estimated": retorno_30y_real == retorno_30y_nominal - 3.0,
+        "is_real_return_estimated": is_estimated,
     }
 
 
-@st.cache_data(ttl=86400)  # Cache for 24 hours
+def _scrape_politely(url):
+    """
+    Scrape a single URL once its host may be requested, capturing any error.
+
+    Args:
+        url (str): URL of the page to scrape
+
+    Returns:
+        tuple: (dict with scraped metrics or None, error detail dict or None)
+    """
+    _wait_for_host(url)
+    try:
+        metricas = scrape_lazyportfolio_30y_metrics(url)
+        logger.info(f"Successfully scraped data for: {metricas['name']}")
+        return metricas, None
+    except Exception as e:
+        logger.error(f"Error scraping {url}: {str(e)}")
+        return None, {"url": url, "error": str(e)}
+
+
 def scrape_multiple_lazyportfolio_30y_metrics(urls):
     """
     Scrape financial metrics from multiple lazyportfolioetf.com URLs.
 
+    URLs are fetched concurrently with a thread pool, since the work is
+    dominated by network I/O. Duplicated URLs are scraped once, and results
+    keep the order in which the URLs first appear.
+
     Args:
         urls (list): List of URLs to scrape
 
     Returns:
         tuple: (DataFrame with scraped metrics, List of errors)
     """
+    # Scrape each page once, even if it is listed more than once
+    urls = list(dict.fromkeys(urls))
     logger.info(f"Starting to scrape {len(urls)} URLs")
+    # One timestamp for the whole batch, formatted once instead of per URL
+    scrape_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     datos = []
     errors = []
 
-    for i, url in enumerate(urls):
-        logger.info(f"Processing URL {i+1}/{len(urls)}: {url}")
-        try:
-            metricas = scrape_lazyportfolio_30y_metrics(url)
-            datos.append(metricas)
-            logger.info(f"Successfully scraped data for: {metricas['name']}")
-        except Exception as e:
-            error_detail = {"url": url, "error": str(e)}
-            errors.append(error_detail)
-            logger.error(f"Error scraping {url}: {str(e)}")
+    max_workers = max(1, min(MAX_WORKERS, len(urls)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for metricas, error in executor.map(_scrape_politely, urls):
+            if error is not None:
+                errors.append(error)
+            else:
+                datos.append(metricas)
 
     logger.info(
         f"Scraping complete. Processed {len(urls)} URLs with {len(errors)} errors"
@@ -256,6 +652,76 @@ def scrape_multiple_lazyportfolio_30y_metrics(urls):
         logger.warning("No data was successfully scraped from any URL")
         return pd.DataFrame(), errors
 
-    df = pd.DataFrame(datos)
+    # Build the frame column by column with known dtypes, instead of having
+    # pandas infer columns and dtypes from a list of dicts
+    columns = {
+        col: pd.array([metricas[col] for metricas in datos], dtype=dtype)
+        for col, dtype in METRIC_DTYPES.items()
+    }
+    columns["scrape_time"] = pd.array(
+        [scrape_time] * len(datos), dtype=pd.ArrowDtype(pa.string())
+    )
+    df = pd.DataFrame(columns)
     logger.info(f"Created DataFrame with {len(df)} rows and {len(df.columns)} columns")
     return df, errors
+
+
+def _cache_file(urls):
+    """
+    Get the on-disk cache file for a list of URLs.
+
+    Args:
+        urls (list): List of URLs, in the order they are scraped
+
+    Returns:
+        Path: Parquet file holding the results for these URLs
+    """
+    key = hashlib.md5("|".join(urls).encode("utf-8")).hexdigest()
+    return CACHE_DIR / f"{key}.parquet"
+
+
+def cached_scrape_multiple_lazyportfolio_30y_metrics(urls, ttl_hours=CACHE_TTL_HOURS):
+    """
+    Scrape multiple URLs, reusing results saved on disk by a previous run.
+
+    Results are only saved when every URL was scraped successfully, so
+    failing URLs are retried on the next call.
+
+    Args:
+        urls (list): List of URLs to scrape
+        ttl_hours (float, optional): Hours before the saved results expire
+
+    Returns:
+        tuple: (DataFrame with scraped metrics, List of errors)
+    """
+    cache_file = _cache_file(urls)
+    if (
+        cache_file.exists()
+        and time.time() - cache_file.stat().st_mtime < ttl_hours * 3600
+    ):
+        logger.info(f"Loading cached metrics from {cache_file}")
+        try:
+            return pd.read_parquet(cache_file, dtype_backend="pyarrow"), []
+        except (OSError, pa.ArrowException) as e:
+            logger.warning(f"Could not load cached metrics from {cache_file}: {e}")
+
+    df, errors = scrape_multiple_lazyportfolio_30y_metrics(urls)
+
+    if not df.empty and not errors:
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file and move it into place, so readers never
+            # see a partially written cache file
+            fd, tmp_name = tempfile.mkstemp(dir=CACHE_DIR, suffix=".parquet.tmp")
+            os.close(fd)
+            try:
+                df.to_parquet(tmp_name, index=False)
+                os.replace(tmp_name, cache_file)
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+            logger.info(f"Saved scraped metrics to {cache_file}")
+        except (OSError, pa.ArrowException) as e:
+            logger.warning(f"Could not save scraped metrics to {cache_file}: {e}")
+
+    return df, errors
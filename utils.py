@@ -1,9 +1,36 @@
+import numpy as np
 import pandas as pd
 import streamlit as st
 
 # Configurar el formato global de números en pandas
 pd.options.display.float_format = "{:.2f}".format
 
+# Numeric columns of the display DataFrame, shown with 2 decimal places
+NUMERIC_DISPLAY_COLUMNS = [
+    "30Y Nominal Return (%)",
+    "30Y Real Return (%)",
+    "Std Deviation (%)",
+    "Nominal Sharpe",
+    "Real Sharpe",
+]
+
+# Display frames kept in the cache; each filter/sort combination adds an entry
+MAX_CACHED_DISPLAY_FRAMES = 32
+
+# URLs shown in the dashboard until the user edits the list
+DEFAULT_URLS = (
+    "https://www.lazyportfolioetf.com/etf/spdr-sp-500-spy/",
+    "https://www.lazyportfolioetf.com/etf/invesco-qqq-trust-qqq/",
+    "https://www.lazyportfolioetf.com/allocation/all-country-world-stocks-portfolio/",
+    "https://www.lazyportfolioetf.com/etf/ishares-7-10-year-treasury-bond-ief/",
+    "https://www.lazyportfolioetf.com/allocation/golden-butterfly/",
+    "https://www.lazyportfolioetf.com/etf/ishares-20-year-treasury-bond/",
+    "https://www.lazyportfolioetf.com/etf/ishares-1-3-year-treasury-bond-shy/",
+    "https://www.lazyportfolioetf.com/etf/spdr-gold-trust-gld/",
+    "https://www.lazyportfolioetf.com/etf/ishares-sp-small-cap-600-value-ijs/",
+    "https://www.lazyportfolioetf.com/etf/vanguard-total-stock-market-vti/",
+)
+
 
 def filter_dataframe(
     df, min_nominal_return=None, min_real_return=None, max_std_dev=None
@@ -20,64 +47,72 @@ def filter_dataframe(
     Returns:
         pd.DataFrame: Filtered DataFrame
     """
-    filtered_df = df.copy()
+    # Build a single mask and slice once, instead of copying per filter
+    mask = np.ones(len(df), dtype=bool)
 
     if min_nominal_return is not None:
-        filtered_df = filtered_df[
-            filtered_df["nominal_30y_return"] >= min_nominal_return
-        ]
+        mask &= df["nominal_30y_return"].to_numpy() >= min_nominal_return
 
     if min_real_return is not None:
-        filtered_df = filtered_df[filtered_df["real_30y_return"] >= min_real_return]
+        mask &= df["real_30y_return"].to_numpy() >= min_real_return
 
     if max_std_dev is not None:
-        filtered_df = filtered_df[filtered_df["std_deviation"] <= max_std_dev]
+        mask &= df["std_deviation"].to_numpy() <= max_std_dev
 
-    return filtered_df
+    return df.loc[mask]
 
 
-def highlight_best_nominal_sharpe(s):
+def highlight_best_sharpe(styler):
     """
-    Highlight the row with the best nominal Sharpe ratio.
+    Highlight the cells with the best nominal and real Sharpe ratios.
+
+    Only the winning cells are styled, instead of computing a style for
+    every value of both columns.
 
     Args:
-        s (pd.Series): Series to highlight
+        styler (pd.io.formats.style.Styler): Styled DataFrame to highlight
 
     Returns:
-        list: Styles for each cell
+        pd.io.formats.style.Styler: Styler with the best Sharpe ratios highlighted
     """
-    is_max = s == s.max()
-    return ["background-color: #90EE90" if v else "" for v in is_max]
+    highlight_colors = {
+        "Nominal Sharpe": "#90EE90",
+        "Real Sharpe": "#ADD8E6",
+    }
 
+    if styler.data.empty:
+        return styler
 
-def highlight_best_real_sharpe(s):
-    """
-    Highlight the row with the best real Sharpe ratio.
+    sharpe_cols = [col for col in highlight_colors if col in styler.data.columns]
+    # Best rows for both columns, from a single comparison on the NumPy values
+    values = styler.data[sharpe_cols].to_numpy(dtype=float, na_value=np.nan)
+    is_best = values == np.nanmax(values, axis=0)
 
-    Args:
-        s (pd.Series): Series to highlight
+    for i, col in enumerate(sharpe_cols):
+        styler = styler.set_properties(
+            subset=pd.IndexSlice[styler.data.index[is_best[:, i]], [col]],
+            **{"background-color": highlight_colors[col]},
+        )
 
-    Returns:
-        list: Styles for each cell
-    """
-    is_max = s == s.max()
-    return ["background-color: #ADD8E6" if v else "" for v in is_max]
+    return styler
 
 
-def format_dataframe_for_display(df, sort_col=None, sort_ascending=True):
+@st.cache_data(show_spinner=False, max_entries=MAX_CACHED_DISPLAY_FRAMES)
+def prepare_display_dataframe(df, sort_col=None, sort_ascending=True):
     """
-    Format DataFrame for display in Streamlit.
+    Rename, sort and round a DataFrame for display.
+
+    Results are cached on the DataFrame content and sort options, so reruns
+    that don't touch the data or the sorting skip this work.
 
     Args:
-        df (pd.DataFrame): DataFrame to format
+        df (pd.DataFrame): DataFrame to prepare
         sort_col (str, optional): Column to sort by
         sort_ascending (bool, optional): Whether to sort in ascending order
 
     Returns:
-        pd.DataFrame: Formatted DataFrame
+        pd.DataFrame: DataFrame ready to be styled for display
     """
-    display_df = df.copy()
-
     # Rename columns for better display
     column_mapping = {
         "name": "Asset Name",
@@ -90,72 +125,48 @@ def format_dataframe_for_display(df, sort_col=None, sort_ascending=True):
         "is_real_return_estimated": "Real Return Estimated",
     }
 
-    # Apply column renaming for columns that exist
-    valid_columns = {k: v for k, v in column_mapping.items() if k in display_df.columns}
-    display_df = display_df.rename(columns=valid_columns)
-
-    # Mark estimated real returns (if column exists)
-    if "Real Return Estimated" in display_df.columns:
-        estimated_indices = display_df[
-            display_df["Real Return Estimated"] == True
-        ].index
-        if not estimated_indices.empty:
-            # Add a note to the real return values that were estimated
-            for idx in estimated_indices:
-                if "30Y Real Return (%)" in display_df.columns:
-                    current_val = display_df.at[idx, "30Y Real Return (%)"]
-                    # Add asterisk as a separate column for display
-                    display_df.at[idx, "30Y Real Return (%)"] = current_val
-
-        # Remove the is_real_return_estimated column as it's now encoded in the values
-        display_df = display_df.drop(columns=["Real Return Estimated"])
-
-    # Remove the URL column from display
-    if "url" in display_df.columns:
-        display_df = display_df.drop(columns=["url"])
+    # Rename, drop the columns that aren't displayed and round the numeric
+    # columns with non-mutating operations, so the input is never copied whole
+    display_df = (
+        df.rename(columns=column_mapping)
+        .drop(columns=["Real Return Estimated", "url"], errors="ignore")
+        .round({col: 2 for col in NUMERIC_DISPLAY_COLUMNS})
+    )
 
     # Sort the DataFrame if a sort column is provided
     if sort_col and sort_col in display_df.columns:
         display_df = display_df.sort_values(by=sort_col, ascending=sort_ascending)
 
-    # Round numeric columns to 2 decimal places
-    numeric_cols = [
-        "30Y Nominal Return (%)",
-        "30Y Real Return (%)",
-        "Std Deviation (%)",
-        "Nominal Sharpe",
-        "Real Sharpe",
-    ]
+    return display_df
+
 
-    for col in numeric_cols:
-        if col in display_df.columns:
-            display_df[col] = display_df[col].apply(lambda x: round(x, 2))
+def format_dataframe_for_display(df, sort_col=None, sort_ascending=True):
+    """
+    Format DataFrame for display in Streamlit.
+
+    Args:
+        df (pd.DataFrame): DataFrame to format
+        sort_col (str, optional): Column to sort by
+        sort_ascending (bool, optional): Whether to sort in ascending order
+
+    Returns:
+        pd.io.formats.style.Styler: Formatted DataFrame
+    """
+    display_df = prepare_display_dataframe(df, sort_col, sort_ascending)
 
     # show only 2 decimal places
     display_df = display_df.style.format(
-        {col: "{:.2f}" for col in numeric_cols if col in display_df.columns}
+        {col: "{:.2f}" for col in NUMERIC_DISPLAY_COLUMNS if col in display_df.columns}
     )
 
     return display_df
 
 
-@st.cache_data(ttl=3600)  # Cache for 1 hour
 def get_default_urls():
     """
     Get default URLs for the dashboard.
 
     Returns:
-        list: List of default URLs
+        tuple: Tuple of default URLs
     """
-    return [
-        "https://www.lazyportfolioetf.com/etf/spdr-sp-500-spy/",
-        "https://www.lazyportfolioetf.com/etf/invesco-qqq-trust-qqq/",
-        "https://www.lazyportfolioetf.com/allocation/all-country-world-stocks-portfolio/",
-        "https://www.lazyportfolioetf.com/etf/ishares-7-10-year-treasury-bond-ief/",
-        "https://www.lazyportfolioetf.com/allocation/golden-butterfly/",
-        "https://www.lazyportfolioetf.com/etf/ishares-20-year-treasury-bond/",
-        "https://www.lazyportfolioetf.com/etf/ishares-1-3-year-treasury-bond-shy/",
-        "https://www.lazyportfolioetf.com/etf/spdr-gold-trust-gld/",
-        "https://www.lazyportfolioetf.com/etf/ishares-sp-small-cap-600-value-ijs/",
-        "https://www.lazyportfolioetf.com/etf/vanguard-total-stock-market-vti/",
-    ]
+    return DEFAULT_URLS
@@ -1,52 +1,160 @@
-import plotly.express as px
+import functools
+import numpy as np
 import plotly.graph_objects as go
-import pandas as pd
+import plotly.io as pio
+import streamlit as st
 
-def create_returns_comparison_chart(df):
+# Figures are serialized to JSON on every render; orjson is much faster than
+# the standard json module on the numeric arrays of the traces, so use it
+# when it is installed
+try:
+    import orjson  # noqa: F401
+    pio.json.config.default_engine = 'orjson'
+except ImportError:
+    pass
+
+# Traces are built from known-good values, so Plotly's property validation is
+# skipped for them (_validate=False). Their values are sent to the browser as
+# float32, which halves the payload and is still far more precise than a chart
+# can show
+
+# Most figures kept per chart type, e.g. for the different filter settings
+MAX_CACHED_FIGURES = 32
+# Scatter plots with more points than this are drawn with WebGL instead of SVG
+WEBGL_MIN_POINTS = 50
+
+# Colors of the nominal and real series, the same in every chart (the first two
+# of Plotly's default palette, so the charts look as they always did)
+NOMINAL_COLOR = '#636EFA'
+REAL_COLOR = '#EF553B'
+_METRIC_COLORS = {
+    'nominal_30y_return': NOMINAL_COLOR,
+    'real_30y_return': REAL_COLOR,
+    'nominal_sharpe': NOMINAL_COLOR,
+    'real_sharpe': REAL_COLOR
+}
+
+# Layout settings that don't depend on the data, built once for every figure
+_BAR_LAYOUT = dict(
+    barmode='relative',
+    xaxis_title='Asset',
+    xaxis_tickangle=-45,
+    legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+    height=500
+)
+_SCATTER_LAYOUT = dict(
+    title='Risk vs Return Analysis',
+    xaxis_title='Standard Deviation (%)',
+    yaxis_title='Real 30Y Return (%)',
+    height=500
+)
+_RADAR_LAYOUT = dict(
+    polar=dict(
+        radialaxis=dict(
+            visible=True,
+            range=[0, 1]
+        )
+    ),
+    showlegend=True,
+    title='Asset Comparison (Normalized Metrics)',
+    height=600
+)
+
+# Metrics on the radar chart axes and their labels, in axis order
+RADAR_METRICS = ['nominal_30y_return', 'real_30y_return', 'std_deviation', 'nominal_sharpe', 'real_sharpe']
+RADAR_CATEGORIES = [
+    'Nominal Return', 
+    'Real Return', 
+    'Stability (inverse of Std Dev)', 
+    'Nominal Sharpe', 
+    'Real Sharpe'
+]
+# Position of std_deviation, the only metric where lower is better
+_RADAR_STD_COLUMN = RADAR_METRICS.index('std_deviation')
+
+def _cached_on_columns(columns):
     """
-    Create a bar chart comparing nominal and real returns.
+    Cache a chart builder on the content of the DataFrame columns it uses.
+    
+    Reruns with unchanged data (e.g. switching tabs) skip rebuilding the
+    figure, and columns the chart doesn't use are left out of the cache key.
+    
+    Args:
+        columns (list): DataFrame columns the chart is built from
+        
+    Returns:
+        function: Decorator for a chart builder taking the DataFrame first
+    """
+    def decorator(build):
+        cached_build = st.cache_data(show_spinner=False, max_entries=MAX_CACHED_FIGURES)(build)
+        
+        @functools.wraps(build)
+        def wrapper(df, *args):
+            return cached_build(df[columns], *args)
+        
+        return wrapper
+    
+    return decorator
+
+def _comparison_bar_chart(df, columns, value_label, type_label, title):
+    """
+    Create a bar chart with one trace per metric, built from the wide columns.
     
     Args:
         df (pd.DataFrame): DataFrame with financial metrics
+        columns (dict): Metric columns to plot, mapped to their display names
+        value_label (str): Title of the value axis
+        type_label (str): Title of the legend
+        title (str): Title of the chart
         
     Returns:
         go.Figure: Plotly figure with the chart
     """
-    df_melted = pd.melt(
-        df, 
-        id_vars=['name'], 
-        value_vars=['nominal_30y_return', 'real_30y_return'],
-        var_name='return_type', 
-        value_name='return_value'
-    )
-    
-    # Replace the column names for better display
-    df_melted['return_type'] = df_melted['return_type'].replace({
-        'nominal_30y_return': '30Y Nominal Return',
-        'real_30y_return': '30Y Real Return'
-    })
-    
-    fig = px.bar(
-        df_melted, 
-        x='name', 
-        y='return_value', 
-        color='return_type',
-        labels={
-            'name': 'Asset',
-            'return_value': 'Return (%)',
-            'return_type': 'Return Type'
-        },
-        title='Nominal vs Real 30-Year Returns'
-    )
+    names = df['name'].to_numpy()
+    fig = go.Figure([
+        go.Bar(
+            x=names,
+            y=df[column].to_numpy(dtype=np.float32),
+            name=label,
+            marker_color=_METRIC_COLORS[column],
+            hovertemplate=f'{type_label}={label}<br>Asset=%{{x}}<br>{value_label}=%{{y}}<extra></extra>',
+            _validate=False
+        )
+        for column, label in columns.items()
+    ])
     
     fig.update_layout(
-        xaxis_tickangle=-45,
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-        height=500
+        _BAR_LAYOUT,
+        title=title,
+        yaxis_title=value_label,
+        legend_title_text=type_label
     )
     
     return fig
 
+@_cached_on_columns(['name', 'nominal_30y_return', 'real_30y_return'])
+def create_returns_comparison_chart(df):
+    """
+    Create a bar chart comparing nominal and real returns.
+    
+    Args:
+        df (pd.DataFrame): DataFrame with financial metrics
+        
+    Returns:
+        go.Figure: Plotly figure with the chart
+    """
+    return _comparison_bar_chart(
+        df,
+        {
+            'nominal_30y_return': '30Y Nominal Return',
+            'real_30y_return': '30Y Real Return'
+        },
+        value_label='Return (%)',
+        type_label='Return Type',
+        title='Nominal vs Real 30-Year Returns'
+    )
+
+@_cached_on_columns(['name', 'std_deviation', 'real_30y_return', 'nominal_sharpe'])
 def create_risk_return_scatter(df):
     """
     Create a scatter plot with returns vs standard deviation.
@@ -57,24 +165,30 @@ def create_risk_return_scatter(df):
     Returns:
         go.Figure: Plotly figure with the chart
     """
-    fig = px.scatter(
-        df, 
-        x='std_deviation', 
-        y='real_30y_return',
-        size='nominal_sharpe',
-        hover_name='name',
-        labels={
-            'std_deviation': 'Standard Deviation (%)',
-            'real_30y_return': 'Real 30Y Return (%)',
-            'nominal_sharpe': 'Nominal Sharpe Ratio'
-        },
-        title='Risk vs Return Analysis'
+    # Bubble area proportional to the Sharpe ratio, the largest one 20px wide
+    sizes = df['nominal_sharpe'].to_numpy(dtype=np.float32)
+    # SVG is crisper for a few points, but WebGL keeps large tables responsive
+    scatter = go.Scattergl if len(df) > WEBGL_MIN_POINTS else go.Scatter
+    fig = go.Figure(
+        data=[scatter(
+            x=df['std_deviation'].to_numpy(dtype=np.float32),
+            y=df['real_30y_return'].to_numpy(dtype=np.float32),
+            mode='markers',
+            hovertext=df['name'].to_numpy(),
+            marker=dict(color=NOMINAL_COLOR, size=sizes, sizemode='area', sizeref=sizes.max() / 20 ** 2),
+            hovertemplate=(
+                '<b>%{hovertext}</b><br><br>Standard Deviation (%)=%{x}<br>'
+                'Real 30Y Return (%)=%{y}<br>Nominal Sharpe Ratio=%{marker.size}<extra></extra>'
+            ),
+            _validate=False
+        )]
     )
     
-    fig.update_layout(height=500)
+    fig.update_layout(_SCATTER_LAYOUT)
     
     return fig
 
+@_cached_on_columns(['name', 'nominal_sharpe', 'real_sharpe'])
 def create_sharpe_comparison_chart(df):
     """
     Create a bar chart comparing nominal and real Sharpe ratios.
@@ -85,41 +199,44 @@ def create_sharpe_comparison_chart(df):
     Returns:
         go.Figure: Plotly figure with the chart
     """
-    df_melted = pd.melt(
-        df, 
-        id_vars=['name'], 
-        value_vars=['nominal_sharpe', 'real_sharpe'],
-        var_name='sharpe_type', 
-        value_name='sharpe_value'
-    )
-    
-    # Replace the column names for better display
-    df_melted['sharpe_type'] = df_melted['sharpe_type'].replace({
-        'nominal_sharpe': 'Nominal Sharpe',
-        'real_sharpe': 'Real Sharpe'
-    })
-    
-    fig = px.bar(
-        df_melted, 
-        x='name', 
-        y='sharpe_value', 
-        color='sharpe_type',
-        labels={
-            'name': 'Asset',
-            'sharpe_value': 'Sharpe Ratio',
-            'sharpe_type': 'Sharpe Ratio Type'
+    return _comparison_bar_chart(
+        df,
+        {
+            'nominal_sharpe': 'Nominal Sharpe',
+            'real_sharpe': 'Real Sharpe'
         },
+        value_label='Sharpe Ratio',
+        type_label='Sharpe Ratio Type',
         title='Nominal vs Real Sharpe Ratios'
     )
+
+def _normalize_radar(values):
+    """
+    Min-max normalize the radar chart metrics of the selected assets.
     
-    fig.update_layout(
-        xaxis_tickangle=-45,
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-        height=500
-    )
+    Args:
+        values (np.ndarray): (assets x RADAR_METRICS) array of metric values
+        
+    Returns:
+        np.ndarray: Values scaled to [0, 1] per metric, higher being better
+    """
+    if len(values) == 1:
+        # A single asset has the same value as itself on every metric
+        normalized = np.ones_like(values)
+    else:
+        min_vals = values.min(axis=0)
+        ranges = values.max(axis=0) - min_vals
+        
+        # Metrics with the same value for every asset are shown as 1
+        constant = ranges == 0
+        normalized = np.where(constant, 1.0, (values - min_vals) / np.where(constant, 1.0, ranges))
     
-    return fig
+    # For std_deviation, lower is better, so invert the normalization
+    normalized[:, _RADAR_STD_COLUMN] = 1 - normalized[:, _RADAR_STD_COLUMN]
+    
+    return normalized
 
+@_cached_on_columns(['name'] + RADAR_METRICS)
 def create_radar_chart(df, selected_assets):
     """
     Create a radar chart comparing multiple metrics for selected assets.
@@ -131,61 +248,28 @@ def create_radar_chart(df, selected_assets):
     Returns:
         go.Figure: Plotly figure with the chart
     """
-    filtered_df = df[df['name'].isin(selected_assets)]
+    # Select the assets' rows straight from the NumPy values, without
+    # building a filtered copy of the DataFrame
+    selected = df['name'].isin(selected_assets).to_numpy()
     
-    if filtered_df.empty:
+    if not selected.any():
         return None
     
-    # Normalize metrics for radar chart
-    metrics = ['nominal_30y_return', 'real_30y_return', 'std_deviation', 'nominal_sharpe', 'real_sharpe']
-    radar_df = filtered_df.copy()
-    
-    for metric in metrics:
-        max_val = radar_df[metric].max()
-        min_val = radar_df[metric].min()
-        
-        if max_val != min_val:
-            radar_df[metric] = (radar_df[metric] - min_val) / (max_val - min_val)
-        else:
-            radar_df[metric] = 1
+    names = df['name'].to_numpy()[selected]
+    values = _normalize_radar(df[RADAR_METRICS].to_numpy(dtype=float)[selected])
     
-    # For std_deviation, lower is better, so invert the normalization
-    radar_df['std_deviation'] = 1 - radar_df['std_deviation']
-    
-    fig = go.Figure()
-    
-    categories = [
-        'Nominal Return', 
-        'Real Return', 
-        'Stability (inverse of Std Dev)', 
-        'Nominal Sharpe', 
-        'Real Sharpe'
-    ]
-    
-    for _, row in radar_df.iterrows():
-        fig.add_trace(go.Scatterpolar(
-            r=[
-                row['nominal_30y_return'],
-                row['real_30y_return'],
-                row['std_deviation'],
-                row['nominal_sharpe'],
-                row['real_sharpe']
-            ],
-            theta=categories,
+    # Build every trace first and add them to the figure in one go
+    fig = go.Figure(data=[
+        go.Scatterpolar(
+            r=r,
+            theta=RADAR_CATEGORIES,
             fill='toself',
-            name=row['name']
-        ))
+            name=name,
+            _validate=False
+        )
+        for name, r in zip(names, values.astype(np.float32))
+    ])
     
-    fig.update_layout(
-        polar=dict(
-            radialaxis=dict(
-                visible=True,
-                range=[0, 1]
-            )
-        ),
-        showlegend=True,
-        title='Asset Comparison (Normalized Metrics)',
-        height=600
-    )
+    fig.update_layout(_RADAR_LAYOUT)
     
     return fig